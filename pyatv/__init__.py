@@ -38,6 +38,7 @@ async def scan(  # pylint: disable=too-many-locals
     hosts: Optional[List[str]] = None,
     aiozc: Optional[AsyncZeroconf] = None,
     storage: Optional[Storage] = None,
+    name: Optional[str] = None,
 ) -> List[interface.BaseConfig]:
     """Scan for Apple TVs on network and return their configurations.
 
@@ -49,6 +50,9 @@ async def scan(  # pylint: disable=too-many-locals
         if not atv.ready:
             return False
 
+        if name is not None and atv.name != name:
+            return False
+
         if identifier:
             target = identifier if isinstance(identifier, set) else {identifier}
             return not target.isdisjoint(atv.all_identifiers)
@@ -67,7 +71,7 @@ async def scan(  # pylint: disable=too-many-locals
         if hosts:
             scanner = UnicastMdnsScanner([IPv4Address(host) for host in hosts], loop)
         else:
-            scanner = MulticastMdnsScanner(loop, identifier)
+            scanner = MulticastMdnsScanner(loop, identifier, name)
 
     protocols = set()
     if protocol:
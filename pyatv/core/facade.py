@@ -43,6 +43,8 @@ DEFAULT_PRIORITIES = [
     Protocol.RAOP,
 ]
 
+_PRIORITY_RANK = {protocol: rank for rank, protocol in enumerate(DEFAULT_PRIORITIES)}
+
 
 class FacadeRemoteControl(Relayer, interface.RemoteControl):
     """Facade implementation for API used to control an Apple TV."""
@@ -265,6 +267,8 @@ class FacadeFeatures(Relayer, interface.Features):
     It is optimized for look up speed rather than memory usage.
     """
 
+    __slots__ = ("_push_updater_relay", "_feature_map")
+
     def __init__(self, push_updater_relay: Relayer) -> None:
         """Initialize a new FacadeFeatures instance."""
         super().__init__(interface.Features, DEFAULT_PRIORITIES)
@@ -299,7 +303,7 @@ class FacadeFeatures(Relayer, interface.Features):
 
     @staticmethod
     def _has_higher_priority(first: Protocol, second: Protocol) -> bool:
-        return DEFAULT_PRIORITIES.index(first) < DEFAULT_PRIORITIES.index(second)
+        return _PRIORITY_RANK[first] < _PRIORITY_RANK[second]
 
 
 class FacadePower(Relayer, interface.Power, interface.PowerListener):
@@ -750,26 +754,26 @@ class FacadeAppleTV(interface.AppleTV):
 
         devinfo: Dict[str, Any] = {}
 
-        # Set up protocols, ignoring duplicates
+        # Group protocols to set up, additional entries for the same protocol are
+        # used as fallbacks in case an earlier one fails to connect
+        candidates: Dict[Protocol, List[SetupData]] = {}
         while not self._protocols_to_setup.empty():
             setup_data = self._protocols_to_setup.get()
+            candidates.setdefault(setup_data.protocol, []).append(setup_data)
 
-            if setup_data.protocol in self._protocol_handlers:
-                _LOGGER.debug(
-                    "Protocol %s already set up, ignoring", setup_data.protocol
-                )
+        # Connect to all protocols concurrently and abort on first error
+        for setup_data in await self._connect_all(list(candidates.values())):
+            if setup_data is None:
                 continue
 
-            _LOGGER.debug("Connecting to protocol: %s", setup_data.protocol)
-            if await setup_data.connect():
-                _LOGGER.debug("Connected to protocol: %s", setup_data.protocol)
-                self._protocol_handlers[setup_data.protocol] = setup_data
+            _LOGGER.debug("Connected to protocol: %s", setup_data.protocol)
+            self._protocol_handlers[setup_data.protocol] = setup_data
 
-                for iface, instance in setup_data.interfaces.items():
-                    self._interfaces[iface].register(instance, setup_data.protocol)
+            for iface, instance in setup_data.interfaces.items():
+                self._interfaces[iface].register(instance, setup_data.protocol)
 
-                self._features.add_mapping(setup_data.protocol, setup_data.features)
-                dict_merge(devinfo, setup_data.device_info())
+            self._features.add_mapping(setup_data.protocol, setup_data.features)
+            dict_merge(devinfo, setup_data.device_info())
 
         self._device_info = interface.DeviceInfo(devinfo)
 
@@ -782,6 +786,64 @@ class FacadeAppleTV(interface.AppleTV):
         except exceptions.NotSupportedError:
             _LOGGER.debug("Power management not supported by any protocols")
 
+    @staticmethod
+    async def _connect_protocol(candidates: List[SetupData]) -> Optional[SetupData]:
+        """Connect to first candidate that succeeds and return it."""
+        for setup_data in candidates:
+            _LOGGER.debug("Connecting to protocol: %s", setup_data.protocol)
+            if await setup_data.connect():
+                return setup_data
+        return None
+
+    @classmethod
+    async def _connect_all(
+        cls, candidates: List[List[SetupData]]
+    ) -> List[Optional[SetupData]]:
+        """Connect to protocols concurrently and return what connected per protocol.
+
+        If a protocol fails to connect, pending connects are cancelled and protocols
+        that already connected are closed before the error is raised.
+        """
+        tasks: List[asyncio.Future[Optional[SetupData]]] = [
+            asyncio.ensure_future(cls._connect_protocol(protocol_candidates))
+            for protocol_candidates in candidates
+        ]
+        if not tasks:
+            return []
+
+        try:
+            _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        errors = [
+            task.exception()
+            for task in tasks
+            if not task.cancelled() and task.exception() is not None
+        ]
+        if not errors:
+            return [task.result() for task in tasks]
+
+        close_tasks: Set[asyncio.Task] = set()
+        for task in tasks:
+            if task.cancelled() or task.exception() is not None:
+                continue
+
+            connected = task.result()
+            if connected is not None:
+                _LOGGER.debug("Closing %s due to failed connect", connected.protocol)
+                close_tasks.update(connected.close())
+        await asyncio.gather(*close_tasks, return_exceptions=True)
+
+        # Raise first error that occurred (in order protocols were added)
+        raise cast(BaseException, errors[0])
+
     def close(self) -> Set[asyncio.Task]:
         """Close connection and release allocated resources."""
         # If close was called before, returning pending tasks
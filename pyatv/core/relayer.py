@@ -40,6 +40,15 @@ T = TypeVar("T")
 class Relayer(Generic[T]):
     """Relay method calls to instances based on priority."""
 
+    # Read on every relayed call, so keep them in slots rather than instance dict
+    __slots__ = (
+        "_base_interface",
+        "_priorities",
+        "_interfaces",
+        "_takeover_protocol",
+        "_relay_cache",
+    )
+
     def __init__(
         self, base_interface: Type[T], protocol_priority: List[Protocol]
     ) -> None:
@@ -49,6 +58,10 @@ class Relayer(Generic[T]):
         self._interfaces: Dict[Protocol, T] = {}
         self._takeover_protocol: List[Protocol] = []
 
+        # Instance to relay to per target when using default priority list. Cleared
+        # whenever registered instances or priorities change.
+        self._relay_cache: Dict[str, T] = {}
+
     @property
     def count(self):
         """Return number of registered instances."""
@@ -81,6 +94,7 @@ class Relayer(Generic[T]):
             raise RuntimeError(f"{protocol} not in priority list")
 
         self._interfaces[protocol] = instance
+        self._relay_cache.clear()
 
     def get(self, protocol: Protocol) -> Optional[T]:
         """Return instance for protocol if available."""
@@ -88,9 +102,17 @@ class Relayer(Generic[T]):
 
     def relay(self, target: str, priority: Optional[List[Protocol]] = None):
         """Return method (or property value) of target instance based on priority."""
-        instance = self._find_instance(
-            target, chain(self._takeover_protocol, priority or self._priorities)
-        )
+        if priority:
+            instance = self._find_instance(
+                target, chain(self._takeover_protocol, priority)
+            )
+        else:
+            instance = self._relay_cache.get(target)
+            if instance is None:
+                instance = self._find_instance(
+                    target, chain(self._takeover_protocol, self._priorities)
+                )
+                self._relay_cache[target] = instance
         return getattr(instance, target)
 
     def _find_instance(self, target: str, priority):
@@ -121,7 +143,9 @@ class Relayer(Generic[T]):
                 f"{self._takeover_protocol[0]} has already done takeover"
             )
         self._takeover_protocol = [protocol]
+        self._relay_cache.clear()
 
     def release(self) -> None:
         """Release temporary takeover."""
         self._takeover_protocol = []
+        self._relay_cache.clear()
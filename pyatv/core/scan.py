@@ -199,10 +199,7 @@ class BaseScanner(ABC):
     def _service_discovered(
         self, service: mdns.Service, response: mdns.Response
     ) -> None:
-        if service.address is None or service.port == 0:
-            return
-
-        result = self._services[service.type][0](service, response)
+        result = self._parse_service(service, response)
         if result:
             name, base_service = result
             _LOGGER.debug(
@@ -230,6 +227,13 @@ class BaseScanner(ABC):
                 self._properties[service.address] = {}
             self._properties[service.address][service.type] = service.properties
 
+    def _parse_service(
+        self, service: mdns.Service, response: mdns.Response
+    ) -> Optional[ScanHandlerReturn]:
+        if service.address is None or service.port == 0:
+            return None
+        return self._services[service.type][0](service, response)
+
     def _get_device_info(self, device: FoundDevice) -> DeviceInfo:
         device_info: Dict[str, Any] = {}
 
@@ -296,6 +300,7 @@ class MulticastMdnsScanner(BaseScanner):
         self,
         loop: asyncio.AbstractEventLoop,
         identifier: Optional[Union[str, Set[str]]] = None,
+        name: Optional[str] = None,
     ):
         """Initialize a new MulticastMdnsScanner."""
         super().__init__()
@@ -303,14 +308,21 @@ class MulticastMdnsScanner(BaseScanner):
         self.identifier: Optional[Set[str]] = (
             {identifier} if isinstance(identifier, str) else identifier
         )
+        self.name = name
 
     async def process(self, timeout: int) -> None:
         """Start to process devices and services."""
+        end_condition: Optional[Callable[[mdns.Response], bool]] = None
+        if self.identifier:
+            end_condition = self._end_if_identifier_found
+        elif self.name:
+            end_condition = self._end_if_name_found
+
         responses = await mdns.multicast(
             self.loop,
             self.services,
             timeout=timeout,
-            end_condition=self._end_if_identifier_found if self.identifier else None,
+            end_condition=end_condition,
         )
         for response in responses:
             self.handle_response(response)
@@ -320,6 +332,22 @@ class MulticastMdnsScanner(BaseScanner):
             set(get_unique_identifiers(response))
         )
 
+    def _end_if_name_found(self, response: mdns.Response) -> bool:
+        for service in response.services:
+            if service.type not in self._services:
+                continue
+
+            try:
+                result = self._parse_service(service, response)
+            except Exception:  # pylint: disable=broad-except
+                # Logged as error by handle_response when scanning has finished
+                _LOGGER.debug("Failed to parse service: %s", service, exc_info=True)
+                continue
+
+            if result and result[0] == self.name:
+                return True
+        return False
+
 
 def _extract_service_name(info: AsyncServiceInfo) -> str:
     return _name_without_type(info.name, info.type)
@@ -16,7 +16,7 @@ from pyatv.const import PairingRequirement
 from pyatv.core import MutableService
 from pyatv.interface import BaseService
 from pyatv.settings import AirPlayVersion
-from pyatv.support import map_range
+from pyatv.support import _map_range_scaled
 from pyatv.support.http import HttpRequest, HttpResponse
 
 # pylint: disable=invalid-name
@@ -31,6 +31,10 @@ DBFS_MAX = 0.0
 PERCENTAGE_MIN = 0.0
 PERCENTAGE_MAX = 100.0
 
+# Ranges are fixed, so scale factors for conversions can be computed up front
+_PCT_TO_DBFS_SCALE = (DBFS_MAX - DBFS_MIN) / (PERCENTAGE_MAX - PERCENTAGE_MIN)
+_DBFS_TO_PCT_SCALE = (PERCENTAGE_MAX - PERCENTAGE_MIN) / (DBFS_MAX - DBFS_MIN)
+
 UNSUPPORTED_MODELS = [r"^Mac\d+,\d+$"]
 
 
@@ -288,7 +292,9 @@ def pct_to_dbfs(level: float) -> float:
         return -144.0
 
     # Map percentage to dBFS
-    return map_range(level, PERCENTAGE_MIN, PERCENTAGE_MAX, DBFS_MIN, DBFS_MAX)
+    return _map_range_scaled(
+        level, PERCENTAGE_MIN, PERCENTAGE_MAX, _PCT_TO_DBFS_SCALE, DBFS_MIN
+    )
 
 
 def dbfs_to_pct(level: float) -> float:
@@ -299,4 +305,6 @@ def dbfs_to_pct(level: float) -> float:
         return PERCENTAGE_MIN
 
     # Map dBFS to percentage
-    return map_range(level, DBFS_MIN, DBFS_MAX, PERCENTAGE_MIN, PERCENTAGE_MAX)
+    return _map_range_scaled(
+        level, DBFS_MIN, DBFS_MAX, _DBFS_TO_PCT_SCALE, PERCENTAGE_MIN
+    )
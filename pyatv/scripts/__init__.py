@@ -7,12 +7,14 @@ import json
 import logging
 
 from pyatv import const
-from pyatv.interface import Storage
+from pyatv.interface import AppleTV, Storage
 from pyatv.storage.file_storage import FileStorage
 from pyatv.storage.memory_storage import MemoryStorage
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT = 10.0
+
 
 # pylint: disable=too-few-public-methods
 class TransformProtocol(argparse.Action):
@@ -125,3 +127,16 @@ def get_storage(args, loop: asyncio.AbstractEventLoop) -> Storage:
 def log_current_version():
     """Log current version of pyatv."""
     _LOGGER.debug("Running with pyatv %s", const.__version__)
+
+
+async def close_connection(atv: AppleTV) -> None:
+    """Close connection to a device and wait for it to finish.
+
+    Errors are logged but not raised, nothing more can be done with the device anyway.
+    """
+    try:
+        remaining_tasks = atv.close()
+        _LOGGER.debug("Waiting for %d remaining tasks", len(remaining_tasks))
+        await asyncio.wait_for(asyncio.gather(*remaining_tasks), DEFAULT_TIMEOUT)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Failed to close connection")
@@ -2,14 +2,16 @@
 
 import argparse
 import asyncio
-import binascii
+import functools
 import inspect
 from ipaddress import IPv4Address
 import logging
+from operator import itemgetter
+import os
+import re
 import sys
 import traceback
-
-from tabulate import tabulate
+from typing import Awaitable, Dict, List, Optional
 
 from pyatv import connect, const, exceptions, interface, pair, scan
 from pyatv.conf import AppleTV, ManualService
@@ -29,6 +31,7 @@ from pyatv.scripts import (
     TransformProtocol,
     VerifyScanHosts,
     VerifyScanProtocols,
+    close_connection,
     create_common_parser,
     get_storage,
     log_current_version,
@@ -37,76 +40,193 @@ from pyatv.support import stringify_model, update_model_field
 
 _LOGGER = logging.getLogger(__name__)
 
-DEFAULT_TIMEOUT = 10.0
+# Argument attributes holding user provided credentials and passwords per protocol
+_CRED_ATTRS: Dict[Protocol, str] = {
+    proto: f"{proto.name.lower()}_credentials" for proto in Protocol
+}
+_PASSWORD_ATTRS: Dict[Protocol, str] = {
+    proto: f"{proto.name.lower()}_password"
+    for proto in (Protocol.AirPlay, Protocol.RAOP)
+}
+
+# Command line arguments for the attributes above: (flag, dest, help)
+_CRED_ARGSPEC = tuple(
+    (f"--{proto.name.lower()}-credentials", attr, f"credentials for {proto.name}")
+    for proto, attr in _CRED_ATTRS.items()
+)
+_PASSWORD_ARGSPEC = tuple(
+    (f"--{proto.name.lower()}-password", attr, f"password for {proto.name}")
+    for proto, attr in _PASSWORD_ATTRS.items()
+)
 
 
-def _print_commands(title, api):
+def _format_commands(title, api) -> str:
     cmd_list = retrieve_commands(api)
     commands = " - " + "\n - ".join(
-        map(lambda x: x[0] + " - " + x[1], sorted(cmd_list.items()))
+        f"{name} - {help_text}"
+        for name, help_text in sorted(cmd_list.items(), key=itemgetter(0))
     )
-    print(f"{title} commands:\n{commands}\n")
+    return f"{title} commands:\n{commands}\n"
 
 
-async def _read_input(loop: asyncio.AbstractEventLoop, prompt: str):
+class StdinReader:
+    """Read lines from stdin without blocking the event loop.
+
+    The stdin file descriptor is watched by the event loop while waiting for a line,
+    so no worker thread is needed. All waiting readers share the same watch and get
+    lines in order. If stdin can't be watched (e.g. it is not backed by a file
+    descriptor or the event loop lacks support for it), lines are read in the
+    default executor instead.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize a new StdinReader instance."""
+        self.loop = loop
+        self._lines: asyncio.Queue = asyncio.Queue()
+        self._buffer = b""
+        self._eof = False
+        self._fileno: Optional[int] = None
+        self._waiters = 0
+
+    async def readline(self) -> str:
+        """Read a line from stdin, returns empty string at end-of-file."""
+        if not self._lines.empty():
+            return self._lines.get_nowait()
+        if self._eof:
+            return ""
+
+        if self._fileno is None:
+            try:
+                fileno = sys.stdin.fileno()
+                self.loop.add_reader(fileno, self._data_available, fileno)
+            except (AttributeError, OSError, ValueError, NotImplementedError):
+                return await self.loop.run_in_executor(None, sys.stdin.readline)
+            self._fileno = fileno
+
+        self._waiters += 1
+        try:
+            return await self._lines.get()
+        finally:
+            self._waiters -= 1
+            if self._waiters == 0:
+                self._stop_reading()
+
+    def close(self) -> None:
+        """Stop reading from stdin and wake up pending readers with end-of-file."""
+        self._stop_reading()
+        self._set_eof()
+
+    def _stop_reading(self) -> None:
+        if self._fileno is not None:
+            self.loop.remove_reader(self._fileno)
+            self._fileno = None
+
+    def _set_eof(self) -> None:
+        if self._buffer:
+            self._lines.put_nowait(self._decode(self._buffer))
+            self._buffer = b""
+        self._eof = True
+        for _ in range(max(self._waiters - self._lines.qsize(), 0)):
+            self._lines.put_nowait("")
+
+    def _data_available(self, fileno: int) -> None:
+        data = os.read(fileno, 1024)
+        if not data:
+            self._stop_reading()
+            self._set_eof()
+            return
+
+        *lines, self._buffer = (self._buffer + data).split(b"\n")
+        for line in lines:
+            self._lines.put_nowait(self._decode(line + b"\n"))
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        return data.decode(sys.stdin.encoding or "utf-8", errors="replace")
+
+
+async def _read_input(stdin: StdinReader, prompt: str):
     sys.stdout.write(prompt)
     sys.stdout.flush()
-    user_input = await loop.run_in_executor(None, sys.stdin.readline)
+    user_input = await stdin.readline()
     return user_input.strip()
 
 
-async def _scan_for_device(args, timeout, storage: Storage, loop, protocol=None):
+async def _scan_for_device(
+    args, timeout, storage: Optional[Storage], loop, protocol=None
+):
     options = {"timeout": timeout, "protocol": protocol}
 
-    if not args.name:
+    # Scanning by name or identifier ends as soon as the device is found
+    if args.name:
+        options["name"] = args.name
+    else:
         options["identifier"] = args.id
     if args.scan_hosts:
         options["hosts"] = args.scan_hosts
 
     atvs = await scan(loop, storage=storage, **options)
 
-    if args.name:
-        devices = [atv for atv in atvs if atv.name == args.name]
-    else:
-        devices = atvs
-
     if not atvs:
         _LOGGER.error("Could not find any Apple TV on current network")
         return None
 
-    if len(devices) > 1:
+    if len(atvs) > 1:
         _LOGGER.error("Found more than one Apple TV; specify one using --id")
-        _print_found_apple_tvs(devices, sys.stderr)
+        _print_found_apple_tvs(atvs, sys.stderr)
         return None
 
-    return devices[0]
+    return atvs[0]
+
+
+def _format_device_table(atvs: List[BaseConfig]) -> str:
+    """Return table with index, device name, model and IP address of devices."""
+    rows = [["", "Name", "Model", "Address"]] + [
+        [str(index + 1), config.name, config.device_info.model_str, str(config.address)]
+        for index, config in enumerate(atvs)
+    ]
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    rows.insert(1, ["-" * width for width in widths])
+    return "\n".join(
+        f"{index:>{widths[0]}}  {name:<{widths[1]}}  {model:<{widths[2]}}  {address}"
+        for index, name, model, address in rows
+    )
+
+
+def _write_file(file_name: str, data: bytes) -> None:
+    with open(file_name, "wb") as file:
+        file.write(data)
 
 
 class GlobalCommands:
     """Commands not bound to a specific device."""
 
-    def __init__(self, args, storage: Storage, loop):
+    def __init__(self, args, storage: Storage, loop, stdin: StdinReader):
         """Initialize a new instance of GlobalCommands."""
         self.args = args
         self.storage = storage
         self.loop = loop
+        self.stdin = stdin
 
     async def commands(self):
         """Print a list with available commands."""
-        _print_commands("Remote control", interface.RemoteControl)
-        _print_commands("Metadata", interface.Metadata)
-        _print_commands("Power", interface.Power)
-        _print_commands("Playing", interface.Playing)
-        _print_commands("AirPlay", interface.Stream)
-        _print_commands("Audio", interface.Audio)
-        _print_commands("Keyboard", interface.Keyboard)
-        _print_commands("Device Info", interface.DeviceInfo)
-        _print_commands("Device", DeviceCommands)
-        _print_commands("Apps", interface.Apps)
-        _print_commands("User Accounts", interface.UserAccounts)
-        _print_commands("Global", self.__class__)
-        _print_commands("Touch", interface.TouchGestures)
-        _print_commands("Settings", SettingsCommands)
+        output = [
+            _format_commands("Remote control", interface.RemoteControl),
+            _format_commands("Metadata", interface.Metadata),
+            _format_commands("Power", interface.Power),
+            _format_commands("Playing", interface.Playing),
+            _format_commands("AirPlay", interface.Stream),
+            _format_commands("Audio", interface.Audio),
+            _format_commands("Keyboard", interface.Keyboard),
+            _format_commands("Device Info", interface.DeviceInfo),
+            _format_commands("Device", DeviceCommands),
+            _format_commands("Apps", interface.Apps),
+            _format_commands("User Accounts", interface.UserAccounts),
+            _format_commands("Global", self.__class__),
+            _format_commands("Touch", interface.TouchGestures),
+            _format_commands("Settings", SettingsCommands),
+        ]
+        print("\n".join(output))
 
         return 0
 
@@ -116,33 +236,8 @@ class GlobalCommands:
             print("Which command do you want help with?", file=sys.stderr)
             return 1
 
-        iface = [
-            interface.RemoteControl,
-            interface.Metadata,
-            interface.Power,
-            interface.Playing,
-            interface.Stream,
-            interface.DeviceInfo,
-            interface.Apps,
-            interface.Audio,
-            interface.Keyboard,
-            interface.TouchGestures,
-            self.__class__,
-            DeviceCommands,
-        ]
-        for cmd in iface:
-            for key, value in cmd.__dict__.items():
-                if key.startswith("_") or key != self.args.command[1]:
-                    continue
-
-                if inspect.isfunction(value):
-                    signature = inspect.signature(value)
-                else:
-                    signature = " (property)"
-
-                print(
-                    f"COMMAND:\n>> {key}{signature}\n\nHELP:\n{inspect.getdoc(value)}"
-                )
+        for help_text in _help_index().get(self.args.command[1], []):
+            print(help_text)
         return 0
 
     async def scan(self):
@@ -179,10 +274,8 @@ class GlobalCommands:
         }
 
         # Inject user provided credentials
-        for proto in Protocol:
-            conf.set_credentials(
-                proto, getattr(self.args, f"{proto.name.lower()}_credentials")
-            )
+        for proto, attr in _CRED_ATTRS.items():
+            conf.set_credentials(proto, getattr(self.args, attr))
 
         # Protocol specific options
         if self.args.protocol == const.Protocol.DMAP:
@@ -211,7 +304,7 @@ class GlobalCommands:
 
         # Ask for PIN if present or just wait for pairing to end
         if pairing.device_provides_pin:
-            pin = await _read_input(self.loop, "Enter PIN on screen: ")
+            pin = await _read_input(self.stdin, "Enter PIN on screen: ")
             pairing.pin(pin)
         else:
             pairing.pin(self.args.pin_code)
@@ -228,7 +321,7 @@ class GlobalCommands:
                     " (press ENTER to stop)"
                 )
 
-            await self.loop.run_in_executor(None, sys.stdin.readline)
+            await self.stdin.readline()
 
         await pairing.finish()
 
@@ -252,20 +345,13 @@ class GlobalCommands:
             print("No devices found!")
             return 1
 
-        # Create a list of devices showing index, device name, model and IP address
-        devices = [
-            [index + 1, config.name, config.device_info.model_str, config.address]
-            for index, config in enumerate(atvs)
-        ]
-
         print("Found the following devices:")
-
-        print(tabulate(devices, headers=["", "Name", "Model", "Address"]))
+        print(_format_device_table(atvs))
 
         index = 0
         while True:
             user_input = await _read_input(
-                self.loop, "Enter index of device to set up (q to quit): "
+                self.stdin, "Enter index of device to set up (q to quit): "
             )
             if user_input == "q":
                 return 0
@@ -297,7 +383,7 @@ class GlobalCommands:
 
         print("Currently playing:")
         print(await atv.metadata.playing())
-        atv.close()
+        await close_connection(atv)
 
         print("Device is now set up!")
         return 0
@@ -319,7 +405,7 @@ Press ENTER to continue
 """
             print(message)
             service.credentials = None
-            await self.loop.run_in_executor(None, sys.stdin.readline)
+            await self.stdin.readline()
             return
         if service.pairing == PairingRequirement.NotNeeded:
             print(f"Ignoring {service.protocol.name} since pairing is not needed")
@@ -343,7 +429,7 @@ Press ENTER to continue
 
         # Ask for PIN if present or just wait for pairing to end
         if pairing.device_provides_pin:
-            pin = await _read_input(self.loop, "Enter PIN on screen: ")
+            pin = await _read_input(self.stdin, "Enter PIN on screen: ")
             pairing.pin(pin)
         else:
             pairing.pin(1234)
@@ -354,7 +440,7 @@ Press ENTER to continue
                 " (press ENTER when you are done)"
             )
 
-            await self.loop.run_in_executor(None, sys.stdin.readline)
+            await self.stdin.readline()
 
         await pairing.finish()
 
@@ -363,7 +449,7 @@ Press ENTER to continue
             print(f"Successfully paired {service.protocol}, moving on...")
         else:
             print("Pairing did not succeed. Press ENTER to continue.")
-            await self.loop.run_in_executor(None, sys.stdin.readline)
+            await self.stdin.readline()
 
     async def _wizard_password(self, service: BaseService) -> None:
         # Nothing to do if password is not required
@@ -372,7 +458,7 @@ Press ENTER to continue
             return
 
         service.password = await _read_input(
-            self.loop, f"Please enter password for {service.protocol}: "
+            self.stdin, f"Please enter password for {service.protocol}: "
         )
 
 
@@ -382,12 +468,13 @@ class DeviceCommands:
     These commands are not part of the API but are provided by atvremote.
     """
 
-    def __init__(self, atv, loop, storage: Storage, args):
+    def __init__(self, atv, loop, storage: Storage, args, stdin: StdinReader):
         """Initialize a new instance of DeviceCommands."""
         self.atv = atv
         self.loop = loop
         self.storage = storage
         self.args = args
+        self.stdin = stdin
 
     async def cli(self):
         """Enter commands in a simple CLI."""
@@ -395,7 +482,7 @@ class DeviceCommands:
         print("Type help for help and exit to quit")
 
         while True:
-            command = await _read_input(self.loop, "pyatv> ")
+            command = await _read_input(self.stdin, "pyatv> ")
             if command.lower() == "exit":
                 break
 
@@ -404,15 +491,16 @@ class DeviceCommands:
                 continue
 
             await _handle_device_command(
-                self.args, command, self.atv, self.storage, self.loop
+                self.args, command, self.atv, self.storage, self.loop, self.stdin
             )
 
     async def artwork_save(self, width=None, height=None, file_name="artwork"):
         """Download artwork and save it to artwork.png."""
         artwork = await self.atv.metadata.artwork(width=width, height=height)
         if artwork is not None:
-            with open(f"{file_name}.png", "wb") as file:
-                file.write(artwork.bytes)
+            await self.loop.run_in_executor(
+                None, _write_file, f"{file_name}.png", artwork.bytes
+            )
         else:
             print("No artwork is currently available.")
             return 1
@@ -429,7 +517,7 @@ class DeviceCommands:
         print("Press ENTER to stop")
 
         self.atv.push_updater.start()
-        await self.loop.run_in_executor(None, sys.stdin.readline)
+        await self.stdin.readline()
         self.atv.push_updater.stop()
         return 0
 
@@ -447,21 +535,23 @@ class DeviceCommands:
         )
         all_features = self.atv.features.all_features(include_unsupported=unsupported)
 
-        print("Feature list:")
-        print("-------------")
+        lines = ["Feature list:", "-------------"]
         for name, feature in all_features.items():
             output = f"{name.name}: {feature.state.name}"
             options = [f"{k}={v}" for k, v in feature.options.items()]
             if options:
                 output += f", Options={', '.join(options)}"
-            print(output)
-
-        print("\nLegend:")
-        print("-------")
-        print("Available: Supported by device and usable now")
-        print("Unavailable: Supported by device but not usable now")
-        print("Unknown: Supported by the device but availability not known")
-        print("Unsupported: Not supported by this device (or by pyatv)")
+            lines.append(output)
+
+        lines += [
+            "\nLegend:",
+            "-------",
+            "Available: Supported by device and usable now",
+            "Unavailable: Supported by device but not usable now",
+            "Unknown: Supported by the device but availability not known",
+            "Unsupported: Not supported by this device (or by pyatv)",
+        ]
+        print("\n".join(lines))
         return 0
 
     async def delay(self, delay_time: int):
@@ -548,8 +638,8 @@ def _in_range(lower, upper, allow_none=False):
     return _checker
 
 
-async def cli_handler(loop):  # pylint: disable=too-many-statements,too-many-branches
-    """Application starts here."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Return argument parser used by atvremote."""
     parser = create_common_parser()
 
     parser.add_argument("command", nargs="+", help="commands, help, ...")
@@ -647,22 +737,12 @@ async def cli_handler(loop):  # pylint: disable=too-many-statements,too-many-bra
     )
 
     creds = parser.add_argument_group("credentials")
-    for prot in Protocol:
-        creds.add_argument(
-            f"--{prot.name.lower()}-credentials",
-            help=f"credentials for {prot.name}",
-            dest=f"{prot.name.lower()}_credentials",
-            default=None,
-        )
+    for flag, dest, help_text in _CRED_ARGSPEC:
+        creds.add_argument(flag, help=help_text, dest=dest, default=None)
 
     passwords = parser.add_argument_group("passwords")
-    for prot in [Protocol.AirPlay, Protocol.RAOP]:
-        passwords.add_argument(
-            f"--{prot.name.lower()}-password",
-            help=f"password for {prot.name}",
-            dest=f"{prot.name.lower()}_password",
-            default=None,
-        )
+    for flag, dest, help_text in _PASSWORD_ARGSPEC:
+        passwords.add_argument(flag, help=help_text, dest=dest, default=None)
 
     debug = parser.add_argument_group("debugging")
     debug.add_argument(
@@ -682,6 +762,12 @@ async def cli_handler(loop):  # pylint: disable=too-many-statements,too-many-bra
         dest="mdns_debug",
     )
 
+    return parser
+
+
+async def cli_handler(loop):  # pylint: disable=too-many-branches
+    """Application starts here."""
+    parser = _build_parser()
     args = parser.parse_args()
     if args.manual and isinstance(args.id, list):
         parser.error("--manual only supports one identifier to --id")
@@ -710,29 +796,37 @@ async def cli_handler(loop):  # pylint: disable=too-many-statements,too-many-bra
             logging.TRAFFIC  # pylint: disable=no-member
         )
 
-    cmds = retrieve_commands(GlobalCommands)
-
+    # Loading storage might be slow, so let it run in parallel with scanning when
+    # auto-discovering a device
     storage = get_storage(args, loop)
-    await storage.load()
+    load_task = asyncio.create_task(storage.load())
+
+    stdin = StdinReader(loop)
 
     try:
-        if args.command[0] in cmds:
-            glob_cmds = GlobalCommands(args, storage, loop)
+        if args.command[0] in _CMD_TABLES["global"]:
+            await load_task
+            glob_cmds = GlobalCommands(args, storage, loop, stdin)
             return await _exec_command(glob_cmds, args.command[0], print_result=False)
         if not args.manual:
-            config = await _autodiscover_device(args, storage, loop)
+            config = await _autodiscover_device(args, storage, loop, load_task)
             if not config:
                 return 1
 
-            return await _handle_commands(args, config, storage, loop)
+            return await _handle_commands(args, config, storage, loop, stdin)
 
         if args.port == 0 or args.address is None or args.protocol is None:
             _LOGGER.error("You must specify address, port and protocol in manual mode")
             return 1
 
+        await load_task
         config = _manual_device(args)
-        return await _handle_commands(args, config, storage, loop)
+        return await _handle_commands(args, config, storage, loop, stdin)
     finally:
+        stdin.close()
+
+        # Never save before storage has been loaded as settings would be lost
+        await load_task
         await storage.save()
 
 
@@ -743,40 +837,43 @@ def _print_found_apple_tvs(atvs, outstream):
         print(f"{apple_tv}\n", file=outstream)
 
 
-async def _autodiscover_device(args, storage: Storage, loop):
-    apple_tv = await _scan_for_device(
-        args, args.scan_timeout, storage, loop, protocol=args.scan_protocols
+async def _autodiscover_device(
+    args, storage: Storage, loop, storage_loaded: Awaitable[None]
+):
+    # Scan without storage as it might not be loaded yet, settings are applied
+    # manually once loading has finished
+    scan_task = asyncio.ensure_future(
+        _scan_for_device(
+            args, args.scan_timeout, None, loop, protocol=args.scan_protocols
+        )
     )
+    try:
+        await storage_loaded
+    except BaseException:
+        scan_task.cancel()
+        await asyncio.gather(scan_task, return_exceptions=True)
+        raise
+
+    apple_tv = await scan_task
     if not apple_tv:
         return None
 
-    def _set_credentials(protocol, field):
-        service = apple_tv.get_service(protocol)
-        if service:
-            # If "" is specified as credentials, unset the field (None)
-            arg_value = getattr(args, field)
-            if arg_value == "":
-                value = None
-            else:
-                value = arg_value or service.credentials
-            service.credentials = value
-
-    def _set_password(protocol, field):
-        service = apple_tv.get_service(protocol)
-        if service:
-            # If "" is specified as password, unset the field (None)
-            arg_value = getattr(args, field)
-            if arg_value == "":
-                value = None
-            else:
-                value = arg_value or service.password
-            service.password = value
+    apple_tv.apply(await storage.get_settings(apple_tv))
 
-    for proto in Protocol:
-        _set_credentials(proto, f"{proto.name.lower()}_credentials")
+    def _override(arg_value, current_value):
+        # If "" is specified as argument, unset the field (None)
+        if arg_value == "":
+            return None
+        return arg_value or current_value
 
-    for proto in [Protocol.RAOP, Protocol.AirPlay]:
-        _set_password(proto, f"{proto.name.lower()}_password")
+    for service in apple_tv.services:
+        service.credentials = _override(
+            getattr(args, _CRED_ATTRS[service.protocol]), service.credentials
+        )
+        if service.protocol in _PASSWORD_ATTRS:
+            service.password = _override(
+                getattr(args, _PASSWORD_ATTRS[service.protocol]), service.password
+            )
 
     _LOGGER.info("Auto-discovered %s at %s", apple_tv.name, apple_tv.address)
 
@@ -798,15 +895,22 @@ def _manual_device(args):
 
     config = AppleTV(IPv4Address(args.address), args.name)
     service = ManualService(args.id, args.protocol, args.port, properties)
-    service.credentials = getattr(args, f"{args.protocol.name.lower()}_credentials")
-    if args.protocol == Protocol.AirPlay:
-        service.password = args.airplay_password
-    elif args.protocol == Protocol.RAOP:
-        service.password = args.raop_password
+    service.credentials = getattr(args, _CRED_ATTRS[args.protocol])
+    if args.protocol in _PASSWORD_ATTRS:
+        service.password = getattr(args, _PASSWORD_ATTRS[args.protocol])
     config.add_service(service)
     return config
 
 
+# Same syntax as accepted by int() for base 10, e.g. "5", "-5", "+5" and "1_000"
+_INT_ARGUMENT = re.compile(r"\s*[+-]?\d+(?:_\d+)*\s*")
+
+# Commands taking an InputAction as argument
+_INPUT_ACTION_CMDS = frozenset(
+    ["up", "down", "left", "right", "select", "menu", "home", "click"]
+)
+
+
 def _extract_command_with_args(cmd):
     """Parse input command with arguments.
 
@@ -819,13 +923,12 @@ def _extract_command_with_args(cmd):
 
     def _typeparse(value):
         # Special case where input is forced to be treated as a string by quoting
-        if isinstance(value, str) and value.startswith('"') and value.endswith('"'):
+        if value[:1] == '"' == value[-1:]:
             return value[1:-1]
 
-        try:
+        if _INT_ARGUMENT.fullmatch(value):
             return int(value)
-        except ValueError:
-            return value
+        return value
 
     def _parse_args(cmd, args):
         args = [_typeparse(x) for x in args]
@@ -833,16 +936,7 @@ def _extract_command_with_args(cmd):
             return [ShuffleState(args[0])]
         if cmd == "set_repeat":
             return [RepeatState(args[0])]
-        if cmd in [
-            "up",
-            "down",
-            "left",
-            "right",
-            "select",
-            "menu",
-            "home",
-            "click",
-        ]:
+        if cmd in _INPUT_ACTION_CMDS:
             return [InputAction(args[0])]
         if cmd == "set_volume":
             return [float(args[0])]
@@ -859,7 +953,7 @@ def _extract_command_with_args(cmd):
     return command, _parse_args(command, args)
 
 
-async def _handle_commands(args, config, storage: Storage, loop):
+async def _handle_commands(args, config, storage: Storage, loop, stdin):
     device_listener = DeviceListener()
     push_listener = PushListener()
     power_listener = PowerListener()
@@ -874,81 +968,113 @@ async def _handle_commands(args, config, storage: Storage, loop):
 
     try:
         for cmd in args.command:
-            ret = await _handle_device_command(args, cmd, atv, storage, loop)
+            ret = await _handle_device_command(args, cmd, atv, storage, loop, stdin)
             if ret != 0:
                 return ret
     finally:
-        remaining_tasks = atv.close()
-        _LOGGER.debug("Waiting for %d remaining tasks", len(remaining_tasks))
-        await asyncio.wait_for(asyncio.gather(*remaining_tasks), DEFAULT_TIMEOUT)
+        await close_connection(atv)
     return 0
 
 
-# pylint: disable=too-many-return-statements disable=too-many-locals
-# pylint: disable=too-many-branches
-async def _handle_device_command(args, cmd, atv, storage: Storage, loop):
-    device = retrieve_commands(DeviceCommands)
-    settings = retrieve_commands(SettingsCommands)
-    ctrl = retrieve_commands(interface.RemoteControl)
-    metadata = retrieve_commands(interface.Metadata)
-    power = retrieve_commands(interface.Power)
-    playing = retrieve_commands(interface.Playing)
-    stream = retrieve_commands(interface.Stream)
-    device_info = retrieve_commands(interface.DeviceInfo)
-    apps = retrieve_commands(interface.Apps)
-    user_accounts = retrieve_commands(interface.UserAccounts)
-    audio = retrieve_commands(interface.Audio)
-    keyboard = retrieve_commands(interface.Keyboard)
-    touch = retrieve_commands(interface.TouchGestures)
+@functools.lru_cache(maxsize=1)
+def _help_index() -> Dict[str, List[str]]:
+    """Return help texts for all commands, indexed by command name."""
+    iface = [
+        interface.RemoteControl,
+        interface.Metadata,
+        interface.Power,
+        interface.Playing,
+        interface.Stream,
+        interface.DeviceInfo,
+        interface.Apps,
+        interface.Audio,
+        interface.Keyboard,
+        interface.TouchGestures,
+        GlobalCommands,
+        DeviceCommands,
+    ]
+    index: Dict[str, List[str]] = {}
+    for cmd in iface:
+        # Commands are already filtered to methods and properties here
+        for key in retrieve_commands(cmd):
+            value = cmd.__dict__[key]
+            if isinstance(value, property):
+                signature = " (property)"
+            else:
+                signature = str(inspect.signature(value))
 
+            index.setdefault(key, []).append(
+                f"COMMAND:\n>> {key}{signature}\n\nHELP:\n{inspect.getdoc(value)}"
+            )
+    return index
+
+
+# Commands are static per class, so introspect them once when module is loaded
+_CMD_TABLES = {
+    "global": retrieve_commands(GlobalCommands),
+    "device": retrieve_commands(DeviceCommands),
+    "settings": retrieve_commands(SettingsCommands),
+    "remote_control": retrieve_commands(interface.RemoteControl),
+    "metadata": retrieve_commands(interface.Metadata),
+    "power": retrieve_commands(interface.Power),
+    "playing": retrieve_commands(interface.Playing),
+    "stream": retrieve_commands(interface.Stream),
+    "device_info": retrieve_commands(interface.DeviceInfo),
+    "apps": retrieve_commands(interface.Apps),
+    "user_accounts": retrieve_commands(interface.UserAccounts),
+    "audio": retrieve_commands(interface.Audio),
+    "keyboard": retrieve_commands(interface.Keyboard),
+    "touch": retrieve_commands(interface.TouchGestures),
+}
+
+# Groups of device commands in priority order, i.e. if a command exists in more than
+# one group, the first group is used. Apart from device, settings and playing, groups
+# are named after the attribute in interface.AppleTV implementing them.
+# NB: audio needs to be above remote_control for now as volume_up/down exists in
+# both but implementations in Audio shall be called
+_DEVICE_CMD_GROUPS = [
+    "device",
+    "settings",
+    "audio",
+    "remote_control",
+    "metadata",
+    "power",
+    "playing",
+    "stream",
+    "keyboard",
+    "device_info",
+    "apps",
+    "user_accounts",
+    "touch",
+]
+
+# Map from command name to group implementing it
+_DISPATCH: Dict[str, str] = {
+    cmd: group for group in reversed(_DEVICE_CMD_GROUPS) for cmd in _CMD_TABLES[group]
+}
+
+
+async def _handle_device_command(args, cmd, atv, storage: Storage, loop, stdin):
     # Parse input command and argument from user
     cmd, cmd_args = _extract_command_with_args(cmd)
-    if cmd in device:
+    group = _DISPATCH.get(cmd)
+    if group is None:
+        _LOGGER.error("Unknown command: %s", cmd)
+        return 1
+
+    if group == "device":
         return await _exec_command(
-            DeviceCommands(atv, loop, storage, args), cmd, False, *cmd_args
+            DeviceCommands(atv, loop, storage, args, stdin), cmd, False, *cmd_args
         )
-    if cmd in settings:
+    if group == "settings":
         return await _exec_command(
             SettingsCommands(atv, loop, storage, args), cmd, False, *cmd_args
         )
-    # NB: Needs to be above RemoteControl for now as volume_up/down exists in both
-    # but implementations in Audio shall be called
-    if cmd in audio:
-        return await _exec_command(atv.audio, cmd, True, *cmd_args)
-
-    if cmd in ctrl:
-        return await _exec_command(atv.remote_control, cmd, True, *cmd_args)
-
-    if cmd in metadata:
-        return await _exec_command(atv.metadata, cmd, True, *cmd_args)
-
-    if cmd in power:
-        return await _exec_command(atv.power, cmd, True, *cmd_args)
-
-    if cmd in playing:
+    if group == "playing":
         playing_resp = await atv.metadata.playing()
         return await _exec_command(playing_resp, cmd, True, *cmd_args)
 
-    if cmd in stream:
-        return await _exec_command(atv.stream, cmd, True, *cmd_args)
-
-    if cmd in keyboard:
-        return await _exec_command(atv.keyboard, cmd, True, *cmd_args)
-
-    if cmd in device_info:
-        return await _exec_command(atv.device_info, cmd, True, *cmd_args)
-
-    if cmd in apps:
-        return await _exec_command(atv.apps, cmd, True, *cmd_args)
-
-    if cmd in user_accounts:
-        return await _exec_command(atv.user_accounts, cmd, True, *cmd_args)
-
-    if cmd in touch:
-        return await _exec_command(atv.touch, cmd, True, *cmd_args)
-
-    _LOGGER.error("Unknown command: %s", cmd)
-    return 1
+    return await _exec_command(getattr(atv, group), cmd, True, *cmd_args)
 
 
 async def _exec_command(obj, command, print_result, *args):
@@ -983,7 +1109,7 @@ def _pretty_print(data):
     if data is None:
         return
     if isinstance(data, bytes):
-        print(binascii.hexlify(data))
+        print(data.hex())
     elif isinstance(data, list):
         print(", ".join([str(item) for item in data]))
     else:
@@ -1017,9 +1143,24 @@ async def appstart(loop):
     return 1
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop, using uvloop if it is installed."""
+    if sys.platform != "win32":
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+
+    return asyncio.new_event_loop()
+
+
 def main():
     """Application start here."""
-    loop = asyncio.get_event_loop()
+    loop = _new_event_loop()
+    asyncio.set_event_loop(loop)
     return loop.run_until_complete(appstart(loop))
 
 
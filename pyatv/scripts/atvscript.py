@@ -30,6 +30,7 @@ from pyatv.scripts import (
     TransformOutput,
     TransformProtocol,
     VerifyScanHosts,
+    close_connection,
     create_common_parser,
     get_storage,
     log_current_version,
@@ -292,7 +293,7 @@ async def _handle_command(
     try:
         return await _run_command(atv, args, abort_sem, loop)
     finally:
-        atv.close()
+        await close_connection(atv)
 
 
 async def _run_command(atv, args, abort_sem, loop):
@@ -1,12 +1,12 @@
 """Support functions used in library."""
 
 import asyncio
-import binascii
 import functools
 import logging
+import operator
 from os import environ, path
 import sys
-from typing import Any, List, Sequence, Union, get_args, get_origin
+from typing import Any, Dict, List, Sequence, Type, Union, get_args, get_origin
 import warnings
 
 from google.protobuf.text_format import MessageToString
@@ -26,17 +26,38 @@ _PROTOBUF_LINE_LENGTH = 150
 _BINARY_LINE_LENGTH = 512
 
 
+def _line_length_from_env(variable: str, default: int) -> int:
+    """Return line length override from environment or default if not valid."""
+    try:
+        return int(environ.get(variable, 0)) or default
+    except ValueError:
+        return default
+
+
+# Line lengths can be overridden via environment variables (read once at import)
+_PROTOBUF_MAX_LINE = _line_length_from_env(
+    "PYATV_PROTOBUF_MAX_LINE", _PROTOBUF_LINE_LENGTH
+)
+_BINARY_MAX_LINE = _line_length_from_env("PYATV_BINARY_MAX_LINE", _BINARY_LINE_LENGTH)
+
+# Arguments to log_binary are logged in call order unless sorting is requested
+_SORT_LOG_KEYS = environ.get("PYATV_SORT_LOG_KEYS") not in (None, "", "0")
+
+
 def _shorten(text: Union[str, bytes], length: int) -> str:
     if isinstance(text, str):
         return text if len(text) < length else (text[: length - 3] + "...")
-    return str(text if len(text) < length else (text[: length - 3] + b"..."))
+    # Bytes are hex encoded (two characters per byte) and shortened accordingly
+    if 2 * len(text) < length:
+        return text.hex()
+    return text[: max(0, (length - 3) // 2)].hex() + "..."
 
 
 def _log_value(value):
     if value is None:
         return ""
     if isinstance(value, bytes):
-        return binascii.hexlify(bytearray(value or b"")).decode()
+        return value.hex()
     return str(value)
 
 
@@ -48,25 +69,30 @@ def prettydataclass(max_length: int = 150):
     in debug logs.
     """
 
-    def _repr(self) -> str:
-        def _format(value: Any) -> str:
-            if isinstance(value, (str, bytes)):
-                return _shorten(value, max_length)
-            return value
-
-        return (
-            self.__class__.__name__
-            + "("
-            + ", ".join(
-                [
-                    f"{f}={_format(getattr(self, f))}"
-                    for f in self.__dataclass_fields__.keys()
-                ]
-            )
-            + ")"
-        )
+    def _format(value: Any) -> Any:
+        if isinstance(value, (str, bytes)):
+            return _shorten(value, max_length)
+        return value
 
     def _wrap(cls):
+        fields = tuple(cls.__dataclass_fields__.keys())
+        if len(fields) > 1:
+            getter = operator.attrgetter(*fields)
+        else:
+            # attrgetter only returns a tuple when given more than one attribute
+            def getter(obj):
+                return tuple(getattr(obj, f) for f in fields)
+
+        def _repr(self) -> str:
+            return (
+                self.__class__.__name__
+                + "("
+                + ", ".join(
+                    f"{f}={_format(value)}" for f, value in zip(fields, getter(self))
+                )
+                + ")"
+            )
+
         setattr(cls, "__repr__", _repr)
         return cls
 
@@ -85,41 +111,54 @@ async def error_handler(func, fallback, *args, **kwargs):
         raise fallback(str(ex)) from ex
 
 
+class _BinaryLogArgs:
+    """Keyword arguments to log_binary, formatted first when the record is emitted."""
+
+    __slots__ = ("_kwargs",)
+
+    def __init__(self, kwargs: Dict[str, Any]) -> None:
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        items = self._kwargs.items()
+        output = []
+        for key, value in sorted(items) if _SORT_LOG_KEYS else items:
+            # Fast path for bytes as that is what is typically logged
+            text = value.hex() if isinstance(value, bytes) else _log_value(value)
+            if len(text) >= _BINARY_MAX_LINE:
+                text = text[: _BINARY_MAX_LINE - 3] + "..."
+            output.append(f"{key}={text}")
+        return ", ".join(output)
+
+
 # Special log method to avoid hexlify conversion if debug is on
 def log_binary(logger, message, level=logging.DEBUG, **kwargs):
     """Log binary data if debug is enabled."""
     if logger.isEnabledFor(level):
-        override_length = int(environ.get("PYATV_BINARY_MAX_LINE", 0))
-        line_length = override_length or _BINARY_LINE_LENGTH
-
-        output = (
-            f"{k}={_shorten(_log_value(v), line_length)}"
-            for k, v in sorted(kwargs.items())
-        )
-
-        logger.debug("%s (%s)", message, ", ".join(output))
+        logger.debug("%s (%s)", message, _BinaryLogArgs(kwargs))
 
 
 def log_protobuf(logger, text, message):
     """Log protobuf message and shorten line length."""
     if logger.isEnabledFor(logging.DEBUG):
-        override_length = int(environ.get("PYATV_PROTOBUF_MAX_LINE", 0))
-        line_length = override_length or _PROTOBUF_LINE_LENGTH
-
         lines = MessageToString(message, print_unknown_fields=True).splitlines()
-        msg_str = "\n".join([_shorten(x, line_length) for x in lines])
+        msg_str = "\n".join([_shorten(x, _PROTOBUF_MAX_LINE) for x in lines])
 
         logger.debug("%s: %s", text, msg_str)
 
 
+@functools.lru_cache(maxsize=None)
+def _is_pyatv_test_file(test_file: str) -> bool:
+    """Return if a test file (relative path) belongs to the pyatv repo."""
+    pyatv_path = path.dirname(path.dirname(pyatv.__file__))
+    return path.exists(path.join(pyatv_path, test_file))
+
+
 def _running_in_pyatv_repo() -> bool:
     """Return pyatv is run via pytest inside its own repo."""
     current_test = environ.get("PYTEST_CURRENT_TEST")
     if current_test:
-        pyatv_path = path.dirname(path.dirname(pyatv.__file__))
-        test_file = current_test.split("::")[0]
-        abs_path = path.join(pyatv_path, test_file)
-        return path.exists(abs_path)
+        return _is_pyatv_test_file(current_test.split("::")[0])
     return False
 
 
@@ -155,21 +194,63 @@ def map_range(
         raise ValueError("invalid input range")
     if out_max - out_min <= 0.0:
         raise ValueError("invalid output range")
+    scale = (out_max - out_min) / (in_max - in_min)
+    return _map_range_scaled(value, in_min, in_max, scale, out_min)
+
+
+def _map_range_scaled(
+    value: float, in_min: float, in_max: float, scale: float, out_min: float
+) -> float:
+    """Map a value to another range using a precomputed scale factor.
+
+    Same as map_range, but scale (output range divided by input range) is computed
+    (and validated) by the caller, e.g. once for fixed ranges.
+    """
     if value < in_min or value > in_max:
         raise ValueError("input value out of range")
-    return (value - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
+    return (value - in_min) * scale + out_min
+
+
+# Lookup tables for shift_hex_identifier: hex byte (lower case) -> incremented byte
+_SHIFTED_HEX_LOWER = {f"{i:02x}": f"{(i + 1) % 256:02x}" for i in range(256)}
+_SHIFTED_HEX_UPPER = {k: v.upper() for k, v in _SHIFTED_HEX_LOWER.items()}
 
 
 def shift_hex_identifier(identifier: str) -> str:
     """Repeatably modify a unique identifier to avoid collisions."""
     assert len(identifier) >= 2
     first, rest = identifier[:2], identifier[2:]
-    shifted = f"{(int(first, 16) + 1) % 256:02x}"
-    if identifier.isupper():
-        shifted = shifted.upper()
+    table = _SHIFTED_HEX_UPPER if identifier.isupper() else _SHIFTED_HEX_LOWER
+    shifted = table.get(first.lower())
+    if shifted is None:
+        raise ValueError(f"invalid hex prefix: {first}")
     return shifted + rest
 
 
+def _type_name(annotation: Any) -> str:
+    """Return printable name of a type annotation."""
+    if annotation is None:
+        return "Any"
+    if get_origin(annotation) is Union:
+        return ", ".join(arg.__name__ for arg in get_args(annotation))
+    return annotation.__name__
+
+
+# Model class -> field name -> name of field type
+_MODEL_FIELD_TYPES: Dict[Type[BaseModel], Dict[str, str]] = {}
+
+
+def _model_field_types(model_type: Type[BaseModel]) -> Dict[str, str]:
+    """Return name of type for each field in a model (cached per model class)."""
+    field_types = _MODEL_FIELD_TYPES.get(model_type)
+    if field_types is None:
+        field_types = _MODEL_FIELD_TYPES[model_type] = {
+            name: _type_name(field_info.annotation)
+            for name, field_info in model_type.model_fields.items()
+        }
+    return field_types
+
+
 def stringify_model(model: BaseModel) -> Sequence[str]:
     """Recursively traverse a pydantic model and print values.
 
@@ -178,22 +259,15 @@ def stringify_model(model: BaseModel) -> Sequence[str]:
     It is assumed optional field does not contain other models (only basic types).
     """
 
-    def _lookup_type(current_model: BaseModel, field_name: str) -> str:
-        value = type(current_model).model_fields[field_name].annotation
-        if value is None:
-            return "Any"
-        if get_origin(value) is Union:
-            return ", ".join(arg.__name__ for arg in get_args(value))
-        return value.__name__
-
     def _recurse_into(
         current_model: BaseModel, prefix: str, output: List[str]
     ) -> Sequence[str]:
+        field_types = _model_field_types(type(current_model))
         for name, field in dict(current_model).items():
             if isinstance(field, BaseModel):
                 _recurse_into(field, (prefix or "") + f"{name}.", output)
             else:
-                field_type = _lookup_type(current_model, name)
+                field_type = field_types[name]
                 output.append(f"{prefix}{name} = {field} ({field_type})")
         return output
 
@@ -204,14 +278,15 @@ def update_model_field(
     model: BaseModel, field: str, value: Union[str, int, float, None]
 ) -> None:
     """Update a field in a model using dotting string path."""
-    splitted_path = field.split(".", maxsplit=1)
-    next_field = splitted_path[0]
+    *parents, leaf = field.split(".")
+
+    for name in parents:
+        if not hasattr(model, name):
+            raise AttributeError(f"{model} has no field {name}")
+        model = getattr(model, name)
 
-    if not hasattr(model, next_field):
-        raise AttributeError(f"{model} has no field {next_field}")
+    if not hasattr(model, leaf):
+        raise AttributeError(f"{model} has no field {leaf}")
 
-    if len(splitted_path) > 1:
-        update_model_field(getattr(model, next_field), splitted_path[1], value)
-    else:
-        model.model_validate({field: value})
-        setattr(model, field, value)
+    model.model_validate({leaf: value})
+    setattr(model, leaf, value)
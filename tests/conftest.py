@@ -123,13 +123,14 @@ async def udns_server(stub_knock_server):
 
 @pytest_asyncio.fixture(name="multicast_scan")
 async def multicast_scan_fixture(udns_server):
-    async def _scan(timeout=1, identifier=None, protocol=None):
+    async def _scan(timeout=1, identifier=None, protocol=None, name=None):
         with fake_udns.stub_multicast(udns_server, asyncio.get_running_loop()):
             return await pyatv.scan(
                 asyncio.get_running_loop(),
                 identifier=identifier,
                 protocol=protocol,
                 timeout=timeout,
+                name=name,
             )
 
     yield _scan
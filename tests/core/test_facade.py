@@ -6,7 +6,7 @@ import inspect
 from ipaddress import IPv4Address
 import logging
 import math
-from typing import Any, Dict, List, Mapping, Set
+from typing import Any, Dict, List, Mapping, Optional, Set
 from unittest.mock import MagicMock
 
 import pytest
@@ -76,10 +76,21 @@ class SetupDataGenerator:
         self.features: set = set(features)
         self.pending_tasks: set = set()
         self.connect_succeeded = True
+        self.connect_exception: Optional[Exception] = None
+        self.connect_blocks = False
+        self.connect_cancelled = False
         self.device_info = {}
 
     async def connect(self):
         self.connect_called = True
+        if self.connect_exception:
+            raise self.connect_exception
+        if self.connect_blocks:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.connect_cancelled = True
+                raise
         return self.connect_succeeded
 
     def close(self):
@@ -302,13 +313,15 @@ async def test_features_multi_instances(facade_dummy, register_interface):
 
 async def test_ignore_already_connected_protocol(facade_dummy, register_interface):
     register_interface(FeatureName.Play, DummyFeatures(FeatureName.Play), Protocol.DMAP)
-    register_interface(
+    _, sdg_second = register_interface(
         FeatureName.Pause, DummyFeatures(FeatureName.Pause), Protocol.DMAP
     )
 
     await facade_dummy.connect()
     feat = facade_dummy.features
 
+    assert not sdg_second.connect_called
+
     assert feat.get_feature(FeatureName.Play).state == FeatureState.Available
 
     # As DMAP was already added with Play as supported, the second instance should be
@@ -316,6 +329,57 @@ async def test_ignore_already_connected_protocol(facade_dummy, register_interfac
     assert feat.get_feature(FeatureName.Pause).state == FeatureState.Unsupported
 
 
+async def test_fallback_to_next_instance_of_protocol(facade_dummy, register_interface):
+    _, sdg_first = register_interface(
+        FeatureName.Play, DummyFeatures(FeatureName.Play), Protocol.DMAP
+    )
+    _, sdg_second = register_interface(
+        FeatureName.Pause, DummyFeatures(FeatureName.Pause), Protocol.DMAP
+    )
+    sdg_first.connect_succeeded = False
+
+    await facade_dummy.connect()
+    feat = facade_dummy.features
+
+    assert sdg_first.connect_called
+    assert sdg_second.connect_called
+
+    # First instance failed to connect, so second instance is used instead
+    assert feat.get_feature(FeatureName.Play).state == FeatureState.Unsupported
+    assert feat.get_feature(FeatureName.Pause).state == FeatureState.Available
+
+
+async def test_connect_failure_cleans_up_other_protocols(
+    facade_dummy, register_interface
+):
+    _, sdg_mrp = register_interface(
+        FeatureName.Play, DummyFeatures(FeatureName.Play), Protocol.MRP
+    )
+    _, sdg_dmap = register_interface(
+        FeatureName.Pause, DummyFeatures(FeatureName.Pause), Protocol.DMAP
+    )
+    _, sdg_airplay = register_interface(
+        FeatureName.Stop, DummyFeatures(FeatureName.Stop), Protocol.AirPlay
+    )
+
+    close_task = asyncio.ensure_future(asyncio.sleep(0))
+    sdg_mrp.pending_tasks.add(close_task)
+    sdg_dmap.connect_exception = exceptions.ConnectionFailedError("failed")
+    sdg_airplay.connect_blocks = True
+
+    with pytest.raises(exceptions.ConnectionFailedError):
+        await facade_dummy.connect()
+
+    # Connected protocol is closed, pending connect is cancelled
+    assert sdg_mrp.close_called
+    assert close_task.done()
+    assert sdg_airplay.connect_cancelled
+    assert not sdg_airplay.close_called
+
+    feat = facade_dummy.features
+    assert feat.get_feature(FeatureName.Play).state == FeatureState.Unsupported
+
+
 async def test_features_feature_overlap_uses_priority(facade_dummy, register_interface):
     # Pause available for DMAP but not MRP -> pause is unavailable because MRP prio
     register_interface(
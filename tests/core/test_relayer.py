@@ -102,6 +102,17 @@ def test_class_priority():
     assert relayer.relay("with_kwargs")(a=4, b=1) == 3
 
 
+def test_register_after_relay_uses_new_instance():
+    relayer = Relayer(BaseClass, [Protocol.MRP, Protocol.DMAP])
+    relayer.register(SubClass4("dmap"), Protocol.DMAP)
+
+    assert relayer.relay("no_args")() == "dmap"
+
+    relayer.register(SubClass4("mrp"), Protocol.MRP)
+
+    assert relayer.relay("no_args")() == "mrp"
+
+
 def test_relay_missing_instance_ignored_and_raises_not_found():
     relayer = Relayer(BaseClass, [Protocol.MRP])
 
@@ -1,7 +1,9 @@
 """Unit tests for scan module."""
 
 import asyncio
-from unittest.mock import patch
+from ipaddress import IPv4Address
+import logging
+from unittest.mock import MagicMock, patch
 
 import pytest
 from zeroconf import (
@@ -20,7 +22,7 @@ from pyatv import scan
 from pyatv.conf import AppleTV
 from pyatv.const import DeviceModel
 from pyatv.core.mdns import Response, Service
-from pyatv.core.scan import get_unique_identifiers
+from pyatv.core.scan import MulticastMdnsScanner, get_unique_identifiers
 
 TEST_SERVICE1 = Service("_service1._tcp.local", "service1", None, 0, {"a": "b"})
 TEST_SERVICE2 = Service("_service2._tcp.local", "service2", None, 0, {"c": "d"})
@@ -261,6 +263,43 @@ def test_unique_identifiers(unique_id_mock, response):
     assert not next(identifiers, None)
 
 
+@pytest.mark.parametrize(
+    "address,port,ended",
+    [
+        (IPv4Address("10.0.0.1"), 1234, True),
+        (IPv4Address("10.0.0.1"), 0, False),
+        (None, 1234, False),
+    ],
+)
+@pytest.mark.asyncio
+async def test_end_condition_name_found(address, port, ended):
+    scanner = MulticastMdnsScanner(asyncio.get_running_loop(), name="service1")
+    scanner.add_service(
+        TEST_SERVICE1.type,
+        (lambda service, response: (service.name, MagicMock()), lambda _: None),
+        lambda *_: {},
+    )
+
+    service = TEST_SERVICE1._replace(address=address, port=port)
+    assert scanner._end_if_name_found(Response([service], False, None)) == ended
+
+
+@pytest.mark.asyncio
+async def test_end_condition_name_parse_error_logged(caplog):
+    scanner = MulticastMdnsScanner(asyncio.get_running_loop(), name="service1")
+    scanner.add_service(
+        TEST_SERVICE1.type,
+        (MagicMock(side_effect=ValueError("bad service")), lambda _: None),
+        lambda *_: {},
+    )
+
+    service = TEST_SERVICE1._replace(address=IPv4Address("10.0.0.1"), port=1234)
+    with caplog.at_level(logging.DEBUG):
+        assert not scanner._end_if_name_found(Response([service], False, None))
+
+    assert "bad service" in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_scan_with_zeroconf_complete_and_device_info():
     aiozc, browser = await _create_zc_with_cache(COMPLETE_RECORD_SET_WITH_DEVICE_INFO)
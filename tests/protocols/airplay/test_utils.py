@@ -1,5 +1,7 @@
 """Unit tests for pyatv.protocols.airplay.features."""
 
+import math
+
 import pytest
 
 from pyatv.auth.hap_pairing import (
@@ -12,11 +14,13 @@ from pyatv.core import MutableService
 from pyatv.protocols.airplay.utils import (
     AirPlayFlags,
     AirPlayMajorVersion,
+    dbfs_to_pct,
     get_pairing_requirement,
     get_protocol_version,
     is_password_required,
     is_remote_control_supported,
     parse_features,
+    pct_to_dbfs,
 )
 from pyatv.settings import AirPlayVersion
 
@@ -163,3 +167,27 @@ def test_is_remote_control_supported(props, credentials, expected_supported):
 def test_get_protocol_version(props, preferred_version, expected_version):
     service = MutableService("id", Protocol.AirPlay, 0, props)
     assert get_protocol_version(service, preferred_version) == expected_version
+
+
+@pytest.mark.parametrize(
+    "pct,dbfs",
+    [(0.0, -144.0), (10.0, -27.0), (50.0, -15.0), (100.0, 0.0)],
+)
+def test_pct_to_dbfs(pct, dbfs):
+    assert math.isclose(pct_to_dbfs(pct), dbfs)
+
+
+@pytest.mark.parametrize(
+    "dbfs,pct",
+    [(-144.0, 0.0), (-30.0, 0.0), (-27.0, 10.0), (-15.0, 50.0), (0.0, 100.0)],
+)
+def test_dbfs_to_pct(dbfs, pct):
+    assert math.isclose(dbfs_to_pct(dbfs), pct, abs_tol=1e-9)
+
+
+@pytest.mark.parametrize(
+    "func,value", [(pct_to_dbfs, -1.0), (pct_to_dbfs, 101.0), (dbfs_to_pct, 1.0)]
+)
+def test_volume_conversion_out_of_range(func, value):
+    with pytest.raises(ValueError):
+        func(value)
@@ -1,12 +1,24 @@
 """Smoke test for atvremote."""
 
+import argparse
 import asyncio
+import os
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
 from pyatv.auth.hap_pairing import parse_credentials
 from pyatv.auth.server_auth import CLIENT_CREDENTIALS
 from pyatv.const import Protocol
+from pyatv.scripts.atvremote import (
+    StdinReader,
+    _autodiscover_device,
+    _extract_command_with_args,
+    _new_event_loop,
+)
+from pyatv.storage.memory_storage import MemoryStorage
 
 from tests.fake_device.airplay import DEVICE_AUTH_KEY, DEVICE_CREDENTIALS, DEVICE_PIN
 from tests.scripts.conftest import AIRPLAY_ID, DMAP_ID, IP_1, IP_2, MRP_ID
@@ -50,6 +62,12 @@ async def test_scan_multiple_identifier(scriptenv):
     assert exit_code == 0
 
 
+async def test_help(scriptenv):
+    stdout, _, exit_code = await scriptenv("atvremote", "help", "volume_up")
+    assert all_in(stdout, ">> volume_up(self)", "Press key volume up.")
+    assert exit_code == 0
+
+
 async def test_pair_airplay(scriptenv):
     stdout, _, exit_code = await scriptenv(
         "atvremote",
@@ -96,6 +114,14 @@ async def test_device_info(scriptenv):
     assert exit_code == 0
 
 
+async def test_device_by_name(scriptenv):
+    stdout, _, exit_code = await scriptenv(
+        "atvremote", "--name", "Apple TV 2", "device_info"
+    )
+    assert all_in(stdout, "tvOS", AIRPLAY_ID)
+    assert exit_code == 0
+
+
 async def test_mrp_auth(scriptenv, fake_atv):
     stdout, _, exit_code = await scriptenv(
         "atvremote", "--id", MRP_ID, "--mrp-credentials", CLIENT_CREDENTIALS, "playing"
@@ -197,3 +223,137 @@ async def test_wizard(scriptenv):
     )
     assert all_in(stdout, DEVICE_AUTH_KEY.lower())
     assert exit_code == 0
+
+
+@pytest.fixture(name="stdin_pipe")
+def stdin_pipe_fixture():
+    read_fd, write_fd = os.pipe()
+    with open(read_fd, encoding="utf-8") as stdin, patch("sys.stdin", stdin):
+        with open(write_fd, "wb", buffering=0) as pipe:
+            yield pipe
+
+
+@pytest_asyncio.fixture(name="stdin_reader")
+async def stdin_reader_fixture(stdin_pipe):
+    loop = asyncio.get_running_loop()
+
+    # Make sure stdin is watched by the event loop and not read in a worker thread
+    with patch.object(loop, "run_in_executor", side_effect=AssertionError):
+        reader = StdinReader(loop)
+        yield reader
+        reader.close()
+
+
+async def test_stdin_reader_multiple_lines_in_one_read(stdin_pipe, stdin_reader):
+    stdin_pipe.write(b"first\nsecond\n")
+
+    assert await asyncio.wait_for(stdin_reader.readline(), 1) == "first\n"
+    assert await asyncio.wait_for(stdin_reader.readline(), 1) == "second\n"
+
+    # Not watching stdin anymore when nobody is waiting for input
+    assert not asyncio.get_running_loop().remove_reader(sys.stdin.fileno())
+
+
+async def test_stdin_reader_partial_line(stdin_pipe, stdin_reader):
+    task = asyncio.ensure_future(stdin_reader.readline())
+
+    stdin_pipe.write(b"par")
+    await asyncio.sleep(0.05)
+    assert not task.done()
+
+    stdin_pipe.write(b"tial\n")
+    assert await asyncio.wait_for(task, 1) == "partial\n"
+
+
+async def test_stdin_reader_eof_flushes_buffer(stdin_pipe, stdin_reader):
+    stdin_pipe.write(b"no newline")
+    stdin_pipe.close()
+
+    assert await asyncio.wait_for(stdin_reader.readline(), 1) == "no newline"
+    assert await asyncio.wait_for(stdin_reader.readline(), 1) == ""
+
+
+async def test_stdin_reader_concurrent_readers(stdin_pipe, stdin_reader):
+    first = asyncio.ensure_future(stdin_reader.readline())
+    second = asyncio.ensure_future(stdin_reader.readline())
+    await asyncio.sleep(0)
+
+    stdin_pipe.write(b"1\n2\n")
+
+    assert await asyncio.wait_for(first, 1) == "1\n"
+    assert await asyncio.wait_for(second, 1) == "2\n"
+
+
+async def test_stdin_reader_close_wakes_readers(stdin_reader):
+    first = asyncio.ensure_future(stdin_reader.readline())
+    second = asyncio.ensure_future(stdin_reader.readline())
+    await asyncio.sleep(0)
+
+    stdin_reader.close()
+
+    assert await asyncio.wait_for(first, 1) == ""
+    assert await asyncio.wait_for(second, 1) == ""
+    assert await stdin_reader.readline() == ""
+
+
+async def test_autodiscover_cancels_scan_if_storage_fails_to_load():
+    scan_started = asyncio.Event()
+    scan_cancelled = asyncio.Event()
+
+    async def _scan_for_device(*args, **kwargs):
+        scan_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            scan_cancelled.set()
+            raise
+
+    async def _load_storage():
+        await scan_started.wait()
+        raise OSError("load failed")
+
+    args = argparse.Namespace(scan_timeout=3, scan_protocols=None)
+    with patch("pyatv.scripts.atvremote._scan_for_device", _scan_for_device):
+        with pytest.raises(OSError):
+            await _autodiscover_device(
+                args, MemoryStorage(), asyncio.get_running_loop(), _load_storage()
+            )
+
+    assert scan_cancelled.is_set()
+
+
+@pytest.mark.parametrize(
+    "cmd,expected_args",
+    [
+        ("cmd=5", [5]),
+        ("cmd=-5", [-5]),
+        ("cmd=+5", [5]),
+        ("cmd=1_000", [1000]),
+        ("cmd=1, 2", [1, 2]),
+        ('cmd="5"', ["5"]),
+        ("cmd=1.5", ["1.5"]),
+        ("cmd=-", ["-"]),
+        ("cmd=abc", ["abc"]),
+    ],
+)
+async def test_extract_command_with_args(cmd, expected_args):
+    assert _extract_command_with_args(cmd) == ("cmd", expected_args)
+
+
+async def test_new_event_loop_uses_uvloop_if_installed():
+    uvloop = MagicMock()
+    with patch.dict(sys.modules, {"uvloop": uvloop}), patch("sys.platform", "linux"):
+        loop = _new_event_loop()
+
+    assert loop is uvloop.new_event_loop.return_value
+
+
+async def test_new_event_loop_without_uvloop():
+    # None in sys.modules makes import raise ImportError
+    with patch.dict(sys.modules, {"uvloop": None}):
+        loop = _new_event_loop()
+
+    try:
+        assert isinstance(loop, asyncio.AbstractEventLoop)
+    finally:
+        loop.close()
@@ -0,0 +1,42 @@
+"""Unit tests for pyatv.scripts."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pyatv.scripts import close_connection
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_close_connection_waits_for_tasks():
+    task = asyncio.ensure_future(asyncio.sleep(0))
+    atv = MagicMock()
+    atv.close.return_value = {task}
+
+    await close_connection(atv)
+
+    assert task.done()
+
+
+async def test_close_connection_logs_error(caplog):
+    atv = MagicMock()
+    atv.close.side_effect = RuntimeError("close failed")
+
+    await close_connection(atv)
+
+    assert "Failed to close connection" in caplog.text
+    assert "close failed" in caplog.text
+
+
+async def test_close_connection_logs_timeout(caplog):
+    task = asyncio.ensure_future(asyncio.Event().wait())
+    atv = MagicMock()
+    atv.close.return_value = {task}
+
+    with patch("pyatv.scripts.DEFAULT_TIMEOUT", 0.01):
+        await close_connection(atv)
+
+    assert task.cancelled()
+    assert "Failed to close connection" in caplog.text
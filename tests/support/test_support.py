@@ -15,6 +15,8 @@ import pytest
 from pyatv import exceptions
 from pyatv.protocols.mrp.protobuf import ProtocolMessage
 from pyatv.support import (
+    _line_length_from_env,
+    _map_range_scaled,
     error_handler,
     log_binary,
     log_protobuf,
@@ -122,6 +124,12 @@ def test_log_binary_log_single_arg_if_enabled(logger):
 
 
 def test_log_binary_log_multiple_args_if_enabled(logger):
+    log_binary(logger, "k", test=b"\x01\x02", dummy=b"\xfe")
+    assert _debug_string(logger) == "k (test=0102, dummy=fe)"
+
+
+@patch("pyatv.support._SORT_LOG_KEYS", True)
+def test_log_binary_log_sorted_args(logger):
     log_binary(logger, "k", test=b"\x01\x02", dummy=b"\xfe")
     assert _debug_string(logger) == "k (dummy=fe, test=0102)"
 
@@ -158,12 +166,26 @@ def test_protobuf_log_limit_message_max_length(logger, message):
     assert len(_debug_string(logger)) == 156
 
 
-@patch.dict(os.environ, {"PYATV_PROTOBUF_MAX_LINE": "5"})
+@patch("pyatv.support._PROTOBUF_MAX_LINE", 5)
 def test_protobuf_log_with_length_override(logger, message):
     log_protobuf(logger, "text", message)
     assert _debug_string(logger) == "text: id..."
 
 
+@pytest.mark.parametrize(
+    "env_value,expected",
+    [("5", 5), ("0", 150), ("", 150), ("abc", 150)],
+)
+def test_line_length_from_env(env_value, expected):
+    with patch.dict(os.environ, {"PYATV_PROTOBUF_MAX_LINE": env_value}):
+        assert _line_length_from_env("PYATV_PROTOBUF_MAX_LINE", 150) == expected
+
+
+def test_line_length_from_env_not_set():
+    with patch.dict(os.environ, clear=True):
+        assert _line_length_from_env("PYATV_PROTOBUF_MAX_LINE", 150) == 150
+
+
 def test_map_range():
     assert math.isclose(map_range(1.0, 0.0, 25.0, 0.0, 100.0), 4.0)
 
@@ -190,12 +212,24 @@ def test_map_range_bad_input_values(value):
         map_range(value, 0.0, 10.0, 20.0, 30.0)
 
 
+def test_map_range_scaled():
+    assert math.isclose(_map_range_scaled(1.0, 0.0, 25.0, 4.0, 0.0), 4.0)
+
+
+@pytest.mark.parametrize("value", [-1.0, 11.0])
+def test_map_range_scaled_bad_input_values(value):
+    with pytest.raises(ValueError):
+        _map_range_scaled(value, 0.0, 10.0, 1.0, 20.0)
+
+
 @pytest.mark.parametrize(
     "input,output",
     [
         ("00:11:22:33:44:55", "01:11:22:33:44:55"),
         ("01:11:22:33:44:55", "02:11:22:33:44:55"),
         ("FF:11:22:33:44:55", "00:11:22:33:44:55"),
+        ("0F:AA:BB:CC:DD:EE", "10:AA:BB:CC:DD:EE"),
+        ("0f:aa:bb:cc:dd:ee", "10:aa:bb:cc:dd:ee"),
         (
             "00000000-1111-2222-3333-444444444444",
             "01000000-1111-2222-3333-444444444444",
@@ -232,15 +266,24 @@ def test_shift_hex_identifier_min_length(input):
         shift_hex_identifier(input)
 
 
+def test_shift_hex_identifier_invalid_hex():
+    with pytest.raises(ValueError):
+        shift_hex_identifier("xy:11:22")
+
+
 @pytest.mark.parametrize(
-    "max_length, data_count, expected",
+    "max_length, data_count, expected, expected_raw",
     [
-        (3, 10, "..."),
-        (4, 10, "a..."),
-        (10, 5, "aaaaa"),
+        (3, 10, "...", "..."),
+        (4, 10, "a...", "..."),
+        (6, 10, "aaa...", "61..."),
+        (10, 5, "aaaaa", "616161..."),
+        (11, 5, "aaaaa", "6161616161"),
     ],
 )
-def test_prettydataclass(max_length: int, data_count: int, expected: str):
+def test_prettydataclass(
+    max_length: int, data_count: int, expected: str, expected_raw: str
+):
     @prettydataclass(max_length=max_length)
     @dataclass
     class Dummy:
@@ -249,7 +292,7 @@ def test_prettydataclass(max_length: int, data_count: int, expected: str):
 
     assert (
         str(Dummy(data=data_count * "a", raw=data_count * b"a"))
-        == f"Dummy(data={expected}, raw=b'{expected}')"
+        == f"Dummy(data={expected}, raw={expected_raw})"
     )
 
 
@@ -327,6 +370,12 @@ def test_update_missing_field_raises():
         update_model_field(SubModel(), "missing", 1)
 
 
+@pytest.mark.parametrize("field", ["missing.a", "sub_model.missing"])
+def test_update_missing_nested_field_raises(field):
+    with pytest.raises(AttributeError):
+        update_model_field(TopModel(), field, 1)
+
+
 def test_update_field_in_submodel():
     model = TopModel()
     update_model_field(model, "sub_model.a", 1234)
@@ -8,10 +8,12 @@ are just called "service1" and "service2" to emphasize that the specific
 protocols are irrelevant. Later, service3 was added as well...
 """
 
+import asyncio
 from ipaddress import ip_address
 
 import pytest
 
+import pyatv
 from pyatv.const import DeviceModel, Protocol
 
 from tests import fake_udns
@@ -91,6 +93,31 @@ async def test_multicast_scan_for_specific_devices(udns_server, multicast_scan):
     assert atvs[0].address == ip_address(SERVICE_2_IP)
 
 
+async def test_multicast_scan_for_device_by_name(udns_server, multicast_scan):
+    udns_server.add_service(service1())
+    udns_server.add_service(service2(address=SERVICE_2_IP))
+
+    atvs = await multicast_scan(name=SERVICE_2_NAME)
+    assert len(atvs) == 1
+    assert atvs[0].name == SERVICE_2_NAME
+    assert atvs[0].address == ip_address(SERVICE_2_IP)
+
+
+async def test_multicast_scan_by_name_ends_when_found(udns_server):
+    udns_server.add_service(service1())
+    udns_server.add_service(service2(address=SERVICE_2_IP))
+
+    loop = asyncio.get_running_loop()
+    with fake_udns.stub_multicast(udns_server, loop) as multicast:
+        await pyatv.scan(loop, name=SERVICE_2_NAME)
+        end_condition = multicast.call_args.kwargs["end_condition"]
+        responses = await multicast(loop, multicast.call_args.args[1])
+
+    ended = [end_condition(response) for response in responses]
+    assert ended.count(True) == 1
+    assert responses[ended.index(True)].services[0].address == ip_address(SERVICE_2_IP)
+
+
 async def test_multicast_scan_deep_sleeping_device(
     udns_server, multicast_scan: Scanner
 ):